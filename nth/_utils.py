@@ -1,5 +1,6 @@
 import typing
 from contextlib import suppress
+from itertools import chain, repeat
 
 _T1 = typing.TypeVar("_T1")
 _T2 = typing.TypeVar("_T2")
@@ -12,6 +13,4 @@ def intersperse(  # noqa
     it = iter(iterable)
     with suppress(StopIteration):
         yield next(it)
-        for v in it:
-            yield fill
-            yield v
+        yield from chain.from_iterable(zip(repeat(fill), it))
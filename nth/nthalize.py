@@ -18,13 +18,13 @@
 from __future__ import annotations
 
 import enum
+import functools
 import logging
 import re
 import typing
 
-from ._utils import intersperse
 from .number import Integer
-from .words import lookup_word, try_lookup_number
+from .words import _try_lookup_number_upper, lookup_word, try_lookup_number
 
 logger = logging.getLogger(__name__)
 
@@ -40,24 +40,34 @@ class Suffix(str, enum.Enum):
     @staticmethod
     def for_int(n: int) -> Suffix:
         """Get suffix for integer."""
-        if 10 < (n % 100) < 20:
+        return _SUFFIX_FOR_MOD_100[n % 100]
+
+
+def _suffix_for_int(n: int) -> Suffix:
+    if 10 < (n % 100) < 20:
+        return Suffix.TH
+    d = n % 10
+    match d:
+        case 1:
+            return Suffix.ST
+        case 2:
+            return Suffix.ND
+        case 3:
+            return Suffix.RD
+        case _:
             return Suffix.TH
-        d = n % 10
-        match d:
-            case 1:
-                return Suffix.ST
-            case 2:
-                return Suffix.ND
-            case 3:
-                return Suffix.RD
-            case _:
-                return Suffix.TH
+
+
+# Suffix only depends on the last two digits; precompute all 100.
+_SUFFIX_FOR_MOD_100 = tuple(_suffix_for_int(n) for n in range(100))
+
+# Bare suffix strings by residue, skipping enum member and .value hops.
+_SUFFIX_VALUE_FOR_MOD_100 = tuple(s.value for s in _SUFFIX_FOR_MOD_100)
 
 
 def int_to_decimal_ordinal(n: int) -> str:
     """Convert integer to decimal ordinal string."""
-    suffix = Suffix.for_int(n)
-    return f"{n}{suffix.value}"
+    return f"{n}{_SUFFIX_VALUE_FOR_MOD_100[n % 100]}"
 
 
 # Match a decimal ordinal (non-strict).
@@ -67,13 +77,28 @@ DECIMAL_ORDINAL_NONSTRICT_P = re.compile(
 )
 
 
+# Valid suffixes in uppercase, for the straight-line check below.
+_SUFFIX_VALUES = frozenset(s.value for s in Suffix)
+
+
 def is_ordinal_decimal(s: str, strict: bool = False) -> bool:
     """Is string a decimal ordinal number."""
-    if m := DECIMAL_ORDINAL_NONSTRICT_P.fullmatch(s):
-        if not strict:
-            return True
-        return s.upper() == int_to_decimal_ordinal(int(m.group(1)))
-    return False
+    # Cheap prefilter: shortest ordinal is "1ST", suffixes end in T/D/H, and the
+    # string must lead with a digit. Most prose tokens fail here.
+    if len(s) < 3 or s[-1] not in "TDHtdh" or not s[0].isdigit():
+        return False
+    # Straight-line equivalent of fullmatching \d+(ST|ND|RD|TH): a whole-string
+    # match is digits up to a two-letter suffix, no regex machinery needed.
+    digits = s[:-2]
+    if not digits.isdecimal():
+        return False
+    suffix = s[-2:].upper()
+    if not strict:
+        return suffix in _SUFFIX_VALUES
+    # Strict ordinals are canonical: no zero-padded digit strings.
+    if len(digits) > 1 and digits[0] == "0":
+        return False
+    return suffix == _SUFFIX_VALUE_FOR_MOD_100[int(digits) % 100]
 
 
 def is_decimal(s: str, strict: bool = False) -> bool:
@@ -86,24 +111,29 @@ def is_decimal(s: str, strict: bool = False) -> bool:
 
 def is_cardinal_decimal(s: str, strict: bool = False) -> bool:
     """Is string a decimal cardinal number."""
-    return s.isdecimal() and not is_ordinal_decimal(s, strict)
+    # A decimal-only string cannot carry an ordinal suffix.
+    del strict
+    return s.isdecimal()
 
 
 def contains_ordinal_decimal(s: str, strict: bool = False) -> bool:
     for m in DECIMAL_ORDINAL_NONSTRICT_P.finditer(s):
         if not strict:
             return True
-        if s.upper() == int_to_decimal_ordinal(int(m.group(1))):
+        digits = m.group(1)
+        if len(digits) > 1 and digits[0] == "0":
+            continue
+        if m.group(2).upper() == _SUFFIX_VALUE_FOR_MOD_100[int(digits) % 100]:
             return True
     return False
 
 
 def try_decimal_to_int(s: str, strict: bool = False) -> int | None:
     """Convert string to integer if it represents a decimal number."""
-    if is_decimal(s, strict):
-        if is_ordinal_decimal(s):
-            return int(s[:-2])
+    if s.isdecimal():
         return int(s)
+    if is_ordinal_decimal(s, strict):
+        return int(s[:-2])
 
 
 def decimal_to_int(s: str, strict: bool = False) -> int:
@@ -133,9 +163,22 @@ class Span(typing.NamedTuple):
         return s[self.to_slice()]
 
 
+def try_lookup_match(m: typing.Match[str]) -> list[Integer] | None:
+    """Lookup {Number} parts of a match or None if any word is not a number."""
+    parts: list[Integer] = []
+    for g in m.groups():
+        if g is None:
+            continue
+        n = try_lookup_number(g)
+        if n is None:
+            return None
+        parts.append(n)
+    return parts
+
+
 def is_number_word_match(m: typing.Match[str]) -> bool:
     """Is Match object over a number word?"""
-    return all(map(is_number_word, filter(None, m.groups())))
+    return try_lookup_match(m) is not None
 
 
 # Roughly match cardinal/ordinal words.
@@ -145,105 +188,163 @@ NUMBERISH_WORD_P = re.compile(
 )
 
 
-def iter_number_spans(s: str) -> typing.Iterator[Span]:
-    """Iterate substring spans that are numeric."""
-    matches: list[typing.Match[str]] = list()
+def iter_number_span_parts(s: str) -> typing.Iterator[tuple[Span, list[Integer]]]:
+    """Iterate numeric substring spans with their looked-up {Number} parts."""
+    span_start = -1
+    span_end = -1
+    last_end = -1
+    parts: list[Integer] = []
+
+    def full_span() -> tuple[Span, list[Integer]] | None:
+        nonlocal span_start, parts
+        if span_start >= 0:
+            res = (Span(span_start, span_end), parts)
+            span_start = -1
+            parts = []
+            return res
 
-    def full_span() -> Span | None:
-        if len(matches) > 0:
-            span = Span(matches[0].start(), matches[-1].end())
-            matches.clear()
-            return span
+    def gap_breaks_span(start: int) -> bool:
+        # Only whitespace may join matches into one span; punctuation between
+        # them (",", ".", ...) ends the number.
+        gap = s[last_end:start]
+        return bool(gap) and not gap.isspace()
 
     for m in NUMBERISH_WORD_P.finditer(s):
         n = m.group()
-        logger.log(1, f"number-ish word {n=} groups={m.groups()} {len(matches)=}")
-        if n == ",":
-            if span := full_span():
-                yield span
-        elif is_decimal(n):
-            if span := full_span():
-                yield span
-            yield Span(*m.span())
-        elif n.upper() == "AND":
+        if logger.isEnabledFor(1):
+            logger.log(1, f"number-ish word {n=} groups={m.groups()} {span_start=}")
+        if len(n) == 3 and n.upper() == "AND":
+            if span_start >= 0:
+                if gap_breaks_span(m.start()):
+                    if sp := full_span():
+                        yield sp
+                else:
+                    # Interior AND: tolerated in the gap but not in the span.
+                    last_end = m.end()
             continue
-        elif is_number_word_match(m):
-            matches.append(m)
-        elif span := full_span():
-            yield span
-    if span := full_span():
+        d: Integer | None = None
+        if n.isdecimal():
+            d = Integer.of(int(n))
+        elif is_ordinal_decimal(n):
+            d = Integer.of(int(n[:-2]), ordinal=True)
+        if d is not None:
+            if sp := full_span():
+                yield sp
+            yield Span(*m.span()), [d]
+        elif (ps := try_lookup_match(m)) is not None:
+            if span_start >= 0 and gap_breaks_span(m.start()):
+                if sp := full_span():
+                    yield sp
+            if span_start < 0:
+                span_start = m.start()
+            span_end = last_end = m.end()
+            parts.extend(ps)
+        elif sp := full_span():
+            yield sp
+    if sp := full_span():
+        yield sp
+
+
+def iter_number_spans(s: str) -> typing.Iterator[Span]:
+    """Iterate substring spans that are numeric."""
+    for span, _ in iter_number_span_parts(s):
         yield span
 
 
 def contains_numbers(s: str) -> bool:
     """Does string contain any number-like sequences?"""
-    del s
-    raise NotImplementedError
-    # try:
-    #     next(iter_number_spans(s))
-    #     return True
-    # except StopIteration:
-    #     return False
+    return next(iter_number_spans(s), None) is not None
 
 
-def try_parse_word_number(
-    s: str,
+# Period multipliers, precomputed past the largest named period (quintillion).
+_POW_1000 = tuple(1000**e for e in range(8))
+
+# Shared additive-identity sentinel (never mutated; __add__ returns new Integers).
+_ZERO = Integer(0)
+
+
+def parse_number_parts(
+    parts: typing.Iterable[Integer | str],
     word_behavior: WordBehavior,
 ) -> typing.Iterator[Integer | str]:
-    """Try to parse as multi-word number."""
+    """Parse looked-up number word parts into full numbers.
+
+    Non-word {Integer} parts (pre-parsed decimals) and plain strings interrupt
+    any number being accumulated and are passed through as-is.
+    """
     # TODO: use word_behavior
     del word_behavior
     n: Integer | None = None
-    stack: list[Integer] = []
-
-    def try_take():
-        if n is not None or len(stack) > 0:
-            res = (n or Integer(0)) + sum(stack)
-            return res
-
-    for w in s.upper().replace("-", " ").split():
-        if w == "AND":
+    # Running total of the stacked parts (None when nothing is stacked; a plain
+    # comparison against 0 would drop a lone ordinal ZERO).
+    stack_sum: Integer | None = None
+
+    def try_take() -> Integer | None:
+        if stack_sum is None:
+            return n
+        return (n or _ZERO) + stack_sum
+
+    for p in parts:
+        if isinstance(p, str) or not p.word:
+            if (v := try_take()) is not None:
+                n = None
+                stack_sum = None
+                yield v
+            yield p
             continue
+        if logger.isEnabledFor(5):
+            logger.log(5, f"part {p=} ({n=} {stack_sum=})")
+        if p.period or p.hundred:
+            f = max(1, stack_sum) if stack_sum is not None else 1
+            stack_sum = None
+            if p.period:
+                e = int(p)
+                v = f * (_POW_1000[e] if e < len(_POW_1000) else 1000**e)
+                n = (n or _ZERO) + v
+            else:  # hundred
+                v = Integer(f * p)
+                stack_sum = v
         else:
-            p = try_lookup_number(w)
-            logger.log(5, f"part {w=} -> {p=} ({n=} {stack=})")
-            if p is None:
-                if (v := try_take()) is not None:
-                    n = None
-                    stack.clear()
-                    yield v
-                yield w
-                continue
-            if p.period or p.hundred:
-                f = max(1, sum(stack))
-                stack.clear()
-                if p.period:
-                    v = f * 1000**p
-                    n = (n or Integer(0)) + v
-                else:  # hundred
-                    v = f * p
-                    stack.append(Integer(v))
-            else:
-                stack.append(p)
-
-            if p.ordinal:
-                if (v := try_take()) is not None:
-                    n = None
-                    stack.clear()
-                    yield v
+            stack_sum = p if stack_sum is None else stack_sum + p
+
+        if p.ordinal:
+            if (v := try_take()) is not None:
+                n = None
+                stack_sum = None
+                yield v
     if (v := try_take()) is not None:
         n = None
-        stack.clear()
+        stack_sum = None
         yield v
 
 
+def try_parse_word_number(
+    s: str,
+    word_behavior: WordBehavior,
+) -> typing.Iterator[Integer | str]:
+    """Try to parse as multi-word number."""
+
+    def lookup_parts() -> typing.Iterator[Integer | str]:
+        for w in (s.replace("-", " ") if "-" in s else s).split():
+            if not w.isupper():
+                w = w.upper()
+            if w == "AND":
+                continue
+            p = _try_lookup_number_upper(w)
+            if logger.isEnabledFor(5):
+                logger.log(5, f"part {w=} -> {p=}")
+            yield w if p is None else p
+
+    yield from parse_number_parts(lookup_parts(), word_behavior)
+
+
 def try_parse_numbers(
     s: str,
     word_behavior: WordBehavior,
 ) -> typing.Iterator[Integer | str]:
     """Try to parse string as number of either decimal or word format."""
     if (n := try_decimal_to_int(s)) is not None:
-        yield Integer(n, ordinal=is_ordinal_decimal(s))
+        yield Integer.of(n, ordinal=is_ordinal_decimal(s))
     else:
         for v in try_parse_word_number(s, word_behavior):
             yield v
@@ -253,12 +354,14 @@ def number_to_word_parts(n: Integer) -> list[Integer]:
     """Construct {Number} parts for conversion to a word format."""
     _n = n.copy()
     if _n == 0:
-        return [_n]
+        # Freshly constructed, never n itself: {number_to_word_str} flips
+        # .ordinal on the last part, which a shared flyweight must not see.
+        return [Integer(0, ordinal=_n.ordinal, word=_n.word)]
 
     parts: list[Integer] = []
     e = 0
     while _n > 0:
-        p = _n % 1000
+        _n, p = divmod(_n, 1000)
         if p > 0 and e > 0:
             a = Integer(e, period=True)
             parts.append(a)
@@ -274,7 +377,6 @@ def number_to_word_parts(n: Integer) -> list[Integer]:
             if h > 0:
                 parts.append(Integer(100))
                 parts.append(Integer(h))
-        _n //= 1000
         e += 1
     return list(reversed(parts))
 
@@ -286,6 +388,7 @@ def number_to_decimal_str(n: Integer, as_ordinal: bool = False) -> str:
     return str(int(n))
 
 
+@functools.lru_cache(maxsize=1024)
 def number_to_word_str(n: Integer, as_ordinal: bool = False) -> str:
     """Convert number to word format string."""
     parts = number_to_word_parts(n)
@@ -304,13 +407,12 @@ def format_number(
     as_words: bool = False,
 ) -> str:
     """Convert to specified format."""
-    res: str | None = None
     if as_words:
         res = number_to_word_str(n, as_ordinal)
     else:
         res = number_to_decimal_str(n, as_ordinal)
-    logger.debug(f"formatted {n=} -> {res=}")
-    assert res is not None
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"formatted {n=} -> {res=}")
     return res
 
 
@@ -396,8 +498,13 @@ def nthalize(s: str, args: NthalizeArgs | None = None):
     """Nthalize throughout a string."""
     _args = _NthalizeArgs.new(args)
 
+    # Select the formatter once instead of re-branching per number.
+    fmt = number_to_word_str if _args.as_word else number_to_decimal_str
+    as_ordinal = _args.as_ordinal
+    word_behavior = _args.word_behavior
+
     def map_n(n: Integer) -> str:
-        return format_number(n, _args.as_ordinal, _args.as_word)
+        return fmt(n, as_ordinal)
 
     def map_nw(n: Integer | str) -> str:
         match n:
@@ -405,22 +512,21 @@ def nthalize(s: str, args: NthalizeArgs | None = None):
                 res = n
             case Integer():
                 res = map_n(n)
-        logger.log(5, f"{n=} -> {res=}")
+        if logger.isEnabledFor(5):
+            logger.log(5, f"{n=} -> {res=}")
         return res
 
     i = 0
     res: list[str] = []
-    for span in iter_number_spans(s):
-        if (w := s[i : span.left]) != "":
+    for (left, right), parts in iter_number_span_parts(s):
+        if (w := s[i:left]) != "":
             res.append(w)
-        w = span.slice(s)
-        logger.debug(f'number span "{w}" {tuple(span)}')
-        n_it = try_parse_numbers(w, _args.word_behavior)
-        a = intersperse(n_it, " ")
-        b = map(map_nw, a)
-        res.extend(b)
-        # res.extend(map(map_nw, intersperse(n_it, " ")))
-        i = span.right
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'number span "{s[left:right]}" {(left, right)}')
+        n_it = parse_number_parts(parts, word_behavior)
+        if (sub := " ".join(map(map_nw, n_it))) != "":
+            res.append(sub)
+        i = right
     if (w := s[i:]) != "":
         res.append(w)
     return "".join(res)
@@ -2,11 +2,8 @@
 
 from __future__ import annotations
 
-import logging
 import typing
 
-logger = logging.getLogger(__name__)
-
 
 class Integer(int):
     """Integer helper."""
@@ -39,6 +36,27 @@ class Integer(int):
         del ordinal, word, period
         return super(Integer, cls).__new__(cls, n)
 
+    @classmethod
+    def of(
+        cls,
+        n: int,
+        ordinal: bool = False,
+        word: bool = False,
+        period: bool = False,
+    ) -> Integer:
+        """Construct, sharing instances for small values (flyweight).
+
+        Shared instances must never have their fields reassigned; callers that
+        mutate (e.g. {number_to_word_parts}) must construct directly instead.
+        """
+        if 0 <= n < 1000:
+            key = (n, ordinal, word, period)
+            r = _SMALL.get(key)
+            if r is None:
+                r = _SMALL[key] = cls(n, ordinal, word, period)
+            return r
+        return cls(n, ordinal, word, period)
+
     def copy(
         self,
         n: int | None = None,
@@ -47,11 +65,14 @@ class Integer(int):
         period: bool | None = None,
     ) -> Integer:
         """Copy this number (and optionally replace particular fields)."""
+        if n is ordinal is word is period is None:
+            # Nothing to replace; instances are never mutated, so share self.
+            return self
         n = n if n is not None else int(self)
         o = ordinal if ordinal is not None else self.ordinal
         w = word if word is not None else self.word
         p = period if period is not None else self.period
-        return Integer(n, o, w, p)
+        return Integer.of(n, o, w, p)
 
     @property
     def hundred(self) -> bool:
@@ -70,11 +91,9 @@ class Integer(int):
 
     def __repr__(self) -> str:
         """Convert to programmer-facing, debugging context, string."""
-        k = "O" if self.ordinal else "C"
-        f = "W" if self.word else ""
-        p = "P" if self.period else ""
+        k = _REPR_PREFIX[self.ordinal << 2 | self.word << 1 | self.period]
         n = f"1000^{int(self)}" if self.period else int(self)
-        return f"{k}{f}{p}({n})"
+        return f"{k}({n})"
 
     def __str__(self) -> str:
         """Convert to interger string.
@@ -91,7 +110,7 @@ class Integer(int):
 
     def __hash__(self):
         """Hash."""
-        return hash(tuple(self))
+        return int.__hash__(self) ^ (self.ordinal << 62) ^ (self.period << 63)
 
     def __eq__(self, other: typing.Any) -> bool:
         """Equality.
@@ -99,31 +118,49 @@ class Integer(int):
         If other is a {Number} equality is strict on all fields; if other is an integer
         then equality is simple integer equality; and is False for any other type.
         """
-        match other:
-            case int():
-                return int(self) == other
-            case Integer():
-                return tuple(self) == tuple(other)
-            case _:
-                return False
-
-    @staticmethod
-    def _op_validate(other: typing.Any):
-        if isinstance(other, Integer):
-            return not other.period
-        return isinstance(other, int)
+        if type(other) is Integer:
+            return (
+                int(self) == int(other)
+                and self.ordinal == other.ordinal
+                and self.period == other.period
+            )
+        if isinstance(other, int):
+            return int(self) == other
+        return False
+
+    def __ne__(self, other: typing.Any) -> bool:
+        """Inequality (without this, int.__ne__ would bypass {__eq__})."""
+        return not self.__eq__(other)
 
     def __add__(self, other: Integer | int) -> Integer:
         """Addition operator."""
         if self.period:
             raise ValueError(f"cannot add lhs={self}")
-        if not Integer._op_validate(other):
-            raise ValueError(f"cannot add rhs={self}")
-        n = int(self) + int(other)
-        o = self.ordinal or isinstance(other, Integer) and other.ordinal
-        # TODO: what to do if differed __word?
-        return Integer(n, o, self.word)
+        if type(other) is Integer:
+            if other.period:
+                raise ValueError(f"cannot add rhs={other}")
+            # TODO: what to do if differed __word?
+            return Integer(
+                int(self) + int(other),
+                self.ordinal or other.ordinal,
+                self.word,
+            )
+        if isinstance(other, int):
+            return Integer(int(self) + other, self.ordinal, self.word)
+        raise ValueError(f"cannot add rhs={other}")
 
     def __radd__(self, other: Integer | int) -> Integer:
         """Reversed addition operator."""
         return self + other
+
+
+# Flyweight table for {Integer.of}, filled lazily with the values actually used.
+_SMALL = dict[tuple[int, bool, bool, bool], Integer]()
+
+# Repr prefixes for each flag combination, indexed by (ordinal, word, period) bits.
+_REPR_PREFIX = tuple(
+    f"{'O' if o else 'C'}{'W' if w else ''}{'P' if p else ''}"
+    for o in (0, 1)
+    for w in (0, 1)
+    for p in (0, 1)
+)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Iterable
 
 from .number import Integer
@@ -18,10 +19,12 @@ def try_lookup_number(w: str) -> Integer | None:
     Only accepts single word numbers, like "1" or "TWENTY", and not "TWENTY ONE".
     For multiword use the full {try_parse} algorithm.
     """
-    _w = w.upper()
-    for d in N_LOOKUPS:
-        if (n := d.get(_w)) is not None:
-            return n
+    return _WORD_TO_N_GET(w if w.isupper() else w.upper())
+
+
+def _try_lookup_number_upper(w: str) -> Integer | None:
+    """Lookup {Number} from an already-uppercased number word."""
+    return _WORD_TO_N_GET(w)
 
 
 def lookup_number(w: str) -> Integer:
@@ -34,9 +37,7 @@ def lookup_number(w: str) -> Integer:
 
 def try_lookup_word(n: Integer) -> str | None:
     """Lookup number word from {Number} or None if not found."""
-    for d in WORD_LOOKUPS:
-        if (w := d.get(n)) is not None:
-            return w
+    return _N_TO_WORD_GET(n)
 
 
 def lookup_word(n: Integer) -> str:
@@ -67,13 +68,14 @@ def make_lookups(
                 aliases = None
             case (n, t, aliases):
                 ...
+        t = sys.intern(t)
         n = Integer(n, ordinal=ordinal, word=False, period=period)
-        w = Integer(n, ordinal=ordinal, word=True, period=period)
+        w = n.copy(word=True)
         n_to_t[n] = t
         t_to_n[t] = w
         if aliases:
             for t in aliases:
-                t_to_n[t] = w
+                t_to_n[sys.intern(t)] = w
     return n_to_t, t_to_n
 
 
@@ -202,9 +204,26 @@ N_LOOKUPS = [
     ORDINAL_PERIOD_TO_N,
 ]
 
+# All word lookups merged into one dict (first lookup wins, as with the list scan).
+WORD_TO_N = dict[str, Integer]()
+for _d in N_LOOKUPS:
+    for _w, _n in _d.items():
+        WORD_TO_N.setdefault(_w, _n)
+
+# Bound-method probe skips an attribute load per lookup.
+_WORD_TO_N_GET = WORD_TO_N.get
+
 WORD_LOOKUPS = [
     N_TO_CARDINAL,
     N_TO_ORDINAL,
     N_TO_CARDINAL_PERIOD,
     N_TO_ORDINAL_PERIOD,
 ]
+
+# All number lookups merged into one dict, mirroring WORD_TO_N.
+N_TO_WORD = dict[Integer, str]()
+for _d in WORD_LOOKUPS:
+    for _n, _t in _d.items():
+        N_TO_WORD.setdefault(_n, _t)
+
+_N_TO_WORD_GET = N_TO_WORD.get
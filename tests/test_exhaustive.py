@@ -89,12 +89,7 @@ params = [
     ),
 ]
 
-CARDINAL, ORDINAL, CARDINAL_WORD, ORDINAL_WORD = L_PARAMS = list(
-    typing.cast(
-        typing.Iterator[list[str]],
-        map(list, zip(*params)),
-    )
-)
+CARDINAL, ORDINAL, CARDINAL_WORD, ORDINAL_WORD = L_PARAMS = tuple(zip(*params))
 
 
 R_PARAMS = [
@@ -105,23 +100,16 @@ R_PARAMS = [
 ]
 
 
-class Truncate:
-    max_width: int
-    tail_width: int
+def make_truncate(max_width: int, tail_width: int) -> typing.Callable[[str], str]:
+    i = max_width - tail_width
 
-    def __init__(self, max_width: int, tail_width: int):
-        self.max_width = max_width
-        self.tail_width = tail_width
+    def truncate(s: str) -> str:
+        return s if len(s) < max_width else f"{s[:i]}...{s[-tail_width:]}"
 
-    def __call__(self, s: str) -> str:
-        if len(s) < self.max_width:
-            return s
-        i = self.max_width - self.tail_width
-        j = self.tail_width
-        return f"{s[:i]}...{s[-j:]}"
+    return truncate
 
 
-TRUNCATE = Truncate(40, 8)
+TRUNCATE = make_truncate(40, 8)
 
 
 class ExhaustiveParam(typing.NamedTuple):
@@ -137,8 +125,8 @@ class ExhaustiveParam(typing.NamedTuple):
 
     @staticmethod
     def from_params(
-        l_params: list[list[str]],
-        r_params: list[tuple[list[str], bool, typing.Callable[[str, bool], str]]],
+        l_params: typing.Sequence[typing.Sequence[str]],
+        r_params: list[tuple[typing.Sequence[str], bool, typing.Callable[[str, bool], str]]],
     ):
         for _expect, as_word, f in r_params:
             for _v in l_params:
@@ -154,7 +142,12 @@ def _test_exhaustive(p: ExhaustiveParam):
     assert lhs == rhs
 
 
-@pytest.mark.parametrize("p", ExhaustiveParam.from_params(L_PARAMS, R_PARAMS), ids=str)
+# Expanded once at import so collection reuses the same tuple and id strings.
+EXHAUSTIVE_PARAMS = tuple(ExhaustiveParam.from_params(L_PARAMS, R_PARAMS))
+EXHAUSTIVE_IDS = tuple(map(str, EXHAUSTIVE_PARAMS))
+
+
+@pytest.mark.parametrize("p", EXHAUSTIVE_PARAMS, ids=EXHAUSTIVE_IDS)
 def test_exhaustive(
     p: ExhaustiveParam,
 ):
@@ -12,6 +12,7 @@ import typing
 import pytest
 
 import nth
+from nth.number import Integer
 
 Converter: typing.TypeAlias = typing.Callable[[str], str]
 
@@ -30,9 +31,26 @@ _O = converter(nth.ordinalize, True)
 
 PARAMS = [
     ("1, 2, and 3", _C, "ONE, TWO, and THREE"),
+    # Punctuation ends a span: words on either side must not sum.
+    ("one, two", _c, "1, 2"),
+    ("a, b, one, two", _c, "a, b, 1, 2"),
+    ("third. million", _c, "3. 1000000"),
+    # Whitespace (and interior AND) still joins words into one number.
+    ("one two", _c, "3"),
+    ("one hundred and five", _c, "105"),
 ]
 
 
 @pytest.mark.parametrize("s,c,expect", PARAMS)
 def test_convert(s: str, c: Converter, expect: str):
     assert c(s) == expect
+
+
+def test_zero_word_ordinal_keeps_shared_zero_cardinal():
+    """Regression: word-ordinalizing "0" must not flag the flyweight zero."""
+    assert nth.ordinalize("0", as_word=True) == "ZERO"
+    assert not Integer.of(0).ordinal
+    [zero] = nth.nthalize.try_parse_numbers(
+        "0", nth.nthalize.default_word_behavior()
+    )
+    assert not zero.ordinal
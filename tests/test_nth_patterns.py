@@ -0,0 +1,220 @@
+"""Test strict decimal ordinal validation.
+
+Originally these tests exercised one regex per suffix (ONES/TWOS/THREES/TEENS/
+OTHERWISE); those patterns were replaced in the library by a mod-100 suffix
+table, so every case now goes through {is_ordinal_decimal} with strict=True.
+The per-suffix parametrizations are kept as complementary partitions of the
+input space.
+"""
+import typing
+
+import pytest
+
+from nth.nthalize import is_ordinal_decimal
+
+# Blocks of consecutive integers whose members (minus the current should-match
+# values) make good wrong-suffix candidates: zeros, teens, and the x0-x3 runs
+# where suffixes actually vary.
+_NS_EXCLUSIONS = (
+    range(0, 10),
+    range(10, 14),
+    range(20, 24),
+    range(100, 104),
+    range(110, 114),
+    range(1000, 1004),
+    range(1010, 1014),
+    range(1100, 1104),
+    range(1110, 1114),
+)
+
+
+def _ns_params(
+    n: int,
+) -> typing.Tuple[typing.List[int], typing.List[int]]:
+    should_match = [
+        n,
+        20 + n,
+        30 + n,
+        40 + n,
+        50 + n,
+        60 + n,
+        70 + n,
+        80 + n,
+        90 + n,
+        100 + n,
+        120 + n,
+        1000 + n,
+        1020 + n,
+        1100 + n,
+        1120 + n,
+        1130 + n,
+    ]
+    in_should = set(should_match)
+    shouldnt_match = [x for r in _NS_EXCLUSIONS for x in r if x not in in_should]
+    return (should_match, shouldnt_match)
+
+
+def _params(
+    should_match: typing.List[int],
+    shouldnt_match: typing.List[int],
+    suffix: str,
+) -> typing.List[typing.Tuple[str, bool]]:
+    return [
+        *[(str(n) + suffix, True) for n in should_match],
+        *[(str(n) + suffix, False) for n in shouldnt_match],
+    ]
+
+
+def _test_pattern(
+    n: str,
+    expected: bool,
+):
+    assert is_ordinal_decimal(n, strict=True) == expected, n
+
+
+_ONES_PARAMS = _params(*_ns_params(1), "st")
+
+
+@pytest.mark.parametrize("n,expected", _ONES_PARAMS, ids=[p[0] for p in _ONES_PARAMS])
+def test_ones(n: str, expected: bool):
+    """Test ones suffix (1st, 21st, etc.)."""
+    _test_pattern(n, expected)
+
+
+_TWOS_PARAMS = _params(*_ns_params(2), "nd")
+
+
+@pytest.mark.parametrize("n,expected", _TWOS_PARAMS, ids=[p[0] for p in _TWOS_PARAMS])
+def test_twos(n: str, expected: bool):
+    """Test twos suffix (2nd, 22nd, etc.)."""
+    _test_pattern(n, expected)
+
+
+_THREES_PARAMS = _params(*_ns_params(3), "rd")
+
+
+@pytest.mark.parametrize("n,expected", _THREES_PARAMS, ids=[p[0] for p in _THREES_PARAMS])
+def test_threes(n: str, expected: bool):
+    """Test threes suffix (3rd, 23rd, etc.)."""
+    _test_pattern(n, expected)
+
+
+def _teens_ns() -> typing.Tuple[typing.List[int], typing.List[int]]:
+    should_match: typing.List[int] = []
+    shouldnt_match: typing.List[int] = []
+    for thousandths in range(2):
+        for hundredths in range(2):
+            base = 1000 * thousandths + 100 * hundredths
+            should_match.extend(range(base + 11, base + 20))
+            for tens in (0, 2, 3):
+                start = base + 10 * tens
+                shouldnt_match.extend(range(start + 1, start + 4))
+    return (should_match, shouldnt_match)
+
+
+_TEENS_PARAMS = _params(*_teens_ns(), "th")
+
+
+@pytest.mark.parametrize("n,expected", _TEENS_PARAMS, ids=[p[0] for p in _TEENS_PARAMS])
+def test_teens(n: str, expected: bool):
+    """Test teens (11th, 12th, ..., 19th, 111th, 112th, etc.)."""
+    _test_pattern(n, expected)
+
+
+def _otherwise_ns() -> typing.Tuple[typing.List[int], typing.List[int]]:
+    should_match: typing.List[int] = []
+    shouldnt_match: typing.List[int] = []
+    for thousandths in range(2):
+        for hundredths in range(3):
+            base = 1000 * thousandths + 100 * hundredths
+            should_match.append(base)
+            should_match.extend(range(base + 4, base + 11))
+            shouldnt_match.extend(range(base + 1, base + 4))
+            for tens in range(2, 10):
+                start = base + 10 * tens
+                should_match.append(start)
+                should_match.extend(range(start + 4, start + 10))
+                shouldnt_match.extend(range(start + 1, start + 4))
+    return (should_match, shouldnt_match)
+
+
+_OTHERWISE_PARAMS = _params(*_otherwise_ns(), "th")
+
+
+@pytest.mark.parametrize("n,expected", _OTHERWISE_PARAMS, ids=[p[0] for p in _OTHERWISE_PARAMS])
+def test_otherwise(n: str, expected: bool):
+    """Test otherwise (4th, ..., 9th, 10th, 20th, 24th, etc.)."""
+    _test_pattern(n, expected)
+
+
+ST = "st"
+ND = "nd"
+RD = "rd"
+TH = "th"
+SUFFIXES = {ST, ND, RD, TH}
+
+# The three wrong suffixes for each right one, computed once instead of a set
+# difference per should-match row.
+_BAD_SUFFIXES = {s: tuple(SUFFIXES - {s}) for s in SUFFIXES}
+
+
+def _strict_params(
+    should_match: typing.List[typing.Tuple[int, str]],
+):
+    # Stringify each n once; the negative rows reuse it for all three bad
+    # suffixes instead of re-formatting per row.
+    strs = [(str(n), suffix) for (n, suffix) in should_match]
+    return [
+        *[(s + suffix, True) for (s, suffix) in strs],
+        *[
+            (s + bad_suffix, False)
+            for (s, suffix) in strs
+            for bad_suffix in _BAD_SUFFIXES[suffix]
+        ],
+    ]
+
+
+def _strict_params_range(
+    thousandths: int,
+    hundredths: int,
+):
+    start = 1000 * thousandths + 100 * hundredths
+
+    def _tens(tens: int):
+        _start = start + 10 * tens
+        return [
+            (_start + 0, TH),
+            (_start + 1, ST),
+            (_start + 2, ND),
+            (_start + 3, RD),
+            *[(_start + n, TH) for n in range(4, 10)],
+        ]
+
+    return [
+        *_tens(0),
+        *[(start + n, TH) for n in range(10, 20)],
+        *[p for tens in range(2, 10) for p in _tens(tens)],
+    ]
+
+
+STRICT_PARAMS = _strict_params(
+    [
+        p
+        for thousandths in range(2)
+        for hundredths in range(2)
+        for p in _strict_params_range(thousandths, hundredths)
+    ],
+)
+
+
+@pytest.mark.parametrize("n,expected", STRICT_PARAMS, ids=[p[0] for p in STRICT_PARAMS])
+def test_strict(n: str, expected: bool):
+    """Test full strict suffix matrix (every suffix against every tens/ones)."""
+    _test_pattern(n, expected)
+
+
+@pytest.mark.parametrize("n", ["01st", "002nd", "013th", "00th"])
+def test_strict_leading_zeros(n: str):
+    """Zero-padded digits are non-canonical: non-strict only."""
+    _test_pattern(n, False)
+    assert is_ordinal_decimal(n)